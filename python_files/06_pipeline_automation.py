@@ -14,11 +14,24 @@
 # %%
 import pandas as pd
 import numpy as np
+import matplotlib
+import sys
+
+# Scheduled runs have no display: draw with Agg unless we're inside Jupyter
+if 'ipykernel' not in sys.modules:
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime, timedelta
+from dataclasses import dataclass
 import os
 
+# Copy-on-Write: derived frames share untouched columns instead of copying
+# them (always enabled from pandas 3.0 onwards)
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.options.mode.copy_on_write = True
+
 print("Libraries loaded!")
 print(f"Current directory: {os.getcwd()}")
 
@@ -69,17 +82,15 @@ def clean_customer_data(df):
     Returns:
     - Cleaned DataFrame
     """
-    # Make a copy to avoid modifying original
-    df_clean = df.copy()
-    
-    # Standardize text fields
-    df_clean['state'] = df_clean['state'].str.upper()
-    
-    # Handle missing values
-    df_clean['phone'] = df_clean['phone'].fillna('Not provided')
-    
-    # Remove duplicates
-    df_clean = df_clean.drop_duplicates(subset=['customer_id'])
+    # Standardize text fields and handle missing values in one step
+    # (assign returns a new DataFrame, so the original is not modified)
+    df_clean = df.assign(
+        state=df['state'].str.upper(),
+        phone=df['phone'].fillna('Not provided')
+    )
+
+    # Remove duplicates (keep the first row for each customer)
+    df_clean = df_clean.loc[~df_clean['customer_id'].duplicated(keep='first')]
     
     return df_clean
 
@@ -138,15 +149,6 @@ def transform_sales_data(df):
     """
     print("Transforming data...")
     
-    # Create a copy
-    df_transformed = df.copy()
-    
-    # Add time features
-    df_transformed['year'] = df_transformed['date'].dt.year
-    df_transformed['month'] = df_transformed['date'].dt.month
-    df_transformed['quarter'] = df_transformed['date'].dt.quarter
-    df_transformed['day_of_week'] = df_transformed['date'].dt.day_name()
-    
     # Categorize sales
     def categorize_sale(amount):
         if amount >= 1000:
@@ -156,13 +158,19 @@ def transform_sales_data(df):
         else:
             return 'Low'
     
-    df_transformed['sale_category'] = df_transformed['total_amount'].apply(categorize_sale)
-    
-    # Calculate commission (5%)
-    df_transformed['commission'] = df_transformed['total_amount'] * 0.05
-    
-    # Standardize region names
-    df_transformed['region'] = df_transformed['region'].str.upper()
+    # Build the new columns in one assign (returns a new DataFrame)
+    df_transformed = df.assign(
+        # Add time features
+        year=df['date'].dt.year,
+        month=df['date'].dt.month,
+        quarter=df['date'].dt.quarter,
+        day_of_week=df['date'].dt.day_name(),
+        sale_category=df['total_amount'].apply(categorize_sale),
+        # Calculate commission (5%)
+        commission=df['total_amount'] * 0.05,
+        # Standardize region names
+        region=df['region'].str.upper()
+    )
     
     print(f"  Transformation complete: {len(df_transformed)} records")
     return df_transformed
@@ -221,103 +229,170 @@ if df_processed is not None:
 # ## 4. Generating Automated Reports
 
 # %%
-def generate_sales_report(df, report_date=None):
+@dataclass
+class ReportBundle:
+    """
+    Processed sales data plus the aggregates shared by the report and dashboard
+    """
+    df: pd.DataFrame
+    region_agg: pd.DataFrame
+    payment_agg: pd.DataFrame
+    daily_sum: pd.Series
+    monthly_sum: pd.Series  # None when the data has no 'month' column
+    product_totals: pd.Series
+    top_products: pd.Series
+    rep_totals: pd.Series
+    total_rev: float
+    mean_txn: float
+    n_customers: int
+    n_products: int
+
+def summarize(df):
+    """
+    Compute every aggregate the report and dashboard need in one place
+    
+    Parameters:
+    - df: processed sales DataFrame
+    
+    Returns:
+    - ReportBundle with the data and its aggregates
+    """
+    # Revenue, average and count per region (largest revenue first)
+    region_agg = df.groupby('region')['total_amount'].agg(['sum', 'mean', 'count'])
+    region_agg.columns = ['Total_Revenue', 'Avg_Transaction', 'Num_Transactions']
+    region_agg = region_agg.sort_values('Total_Revenue', ascending=False)
+    
+    # Revenue, count and share of revenue per payment method
+    payment_agg = df.groupby('payment_method')['total_amount'].agg(['sum', 'count'])
+    payment_agg.columns = ['Total_Revenue', 'Num_Transactions']
+    payment_agg = payment_agg.sort_values('Total_Revenue', ascending=False)
+    revenue = payment_agg['Total_Revenue'].to_numpy()
+    payment_agg['Pct'] = revenue / revenue.sum() * 100
+    
+    product_totals = df.groupby('product_id', sort=False)['total_amount'].sum()
+    
+    monthly_sum = None
+    if 'month' in df.columns:
+        monthly_sum = df.groupby('month')['total_amount'].sum()
+    
+    return ReportBundle(
+        df=df,
+        region_agg=region_agg,
+        payment_agg=payment_agg,
+        # Bin by calendar day (days without sales show as 0)
+        daily_sum=df.set_index('date')['total_amount'].resample('D').sum(),
+        monthly_sum=monthly_sum,
+        product_totals=product_totals,
+        top_products=product_totals.nlargest(10),
+        rep_totals=df.groupby('sales_rep', sort=False)['total_amount'].sum(),
+        total_rev=df['total_amount'].sum(),
+        mean_txn=df['total_amount'].mean(),
+        n_customers=df['customer_id'].nunique(),
+        n_products=df['product_id'].nunique()
+    )
+
+def generate_sales_report(bundle, report_date=None):
     """
-    Generate a comprehensive sales report
+    Generate a comprehensive sales report from a ReportBundle
     """
     if report_date is None:
         report_date = datetime.now().strftime('%Y-%m-%d')
+    df = bundle.df
     
-    print("=" * 60)
-    print(f"SALES REPORT - Generated on {report_date}")
-    print("=" * 60)
+    # Collect the report lines and print them in one go at the end
+    lines = [
+        "=" * 60,
+        f"SALES REPORT - Generated on {report_date}",
+        "=" * 60
+    ]
     
     # Overall metrics
-    print("\n📊 OVERALL METRICS")
-    print("-" * 60)
-    print(f"Total Revenue:        ${df['total_amount'].sum():>15,.2f}")
-    print(f"Average Transaction:  ${df['total_amount'].mean():>15,.2f}")
-    print(f"Total Transactions:   {len(df):>18,}")
-    print(f"Unique Customers:     {df['customer_id'].nunique():>18,}")
-    print(f"Unique Products:      {df['product_id'].nunique():>18,}")
+    lines += [
+        "\n📊 OVERALL METRICS",
+        "-" * 60,
+        f"Total Revenue:        ${bundle.total_rev:>15,.2f}",
+        f"Average Transaction:  ${bundle.mean_txn:>15,.2f}",
+        f"Total Transactions:   {len(df):>18,}",
+        f"Unique Customers:     {bundle.n_customers:>18,}",
+        f"Unique Products:      {bundle.n_products:>18,}"
+    ]
     
     # Regional breakdown
-    print("\n🌍 REGIONAL BREAKDOWN")
-    print("-" * 60)
-    regional_sales = df.groupby('region')['total_amount'].agg(['sum', 'mean', 'count'])
-    regional_sales.columns = ['Total_Revenue', 'Avg_Transaction', 'Num_Transactions']
-    regional_sales = regional_sales.sort_values('Total_Revenue', ascending=False)
-    
-    for region, row in regional_sales.iterrows():
-        print(f"\n{region}:")
-        print(f"  Total Revenue:     ${row['Total_Revenue']:,.2f}")
-        print(f"  Avg Transaction:   ${row['Avg_Transaction']:,.2f}")
-        print(f"  Transactions:      {int(row['Num_Transactions']):,}")
+    lines += ["\n🌍 REGIONAL BREAKDOWN", "-" * 60]
+    
+    # itertuples is much cheaper than iterrows (no Series per row)
+    lines.extend(
+        f"\n{row.Index}:\n"
+        f"  Total Revenue:     ${row.Total_Revenue:,.2f}\n"
+        f"  Avg Transaction:   ${row.Avg_Transaction:,.2f}\n"
+        f"  Transactions:      {int(row.Num_Transactions):,}"
+        for row in bundle.region_agg.itertuples()
+    )
     
     # Top performers
-    print("\n🏆 TOP PERFORMERS")
-    print("-" * 60)
+    lines += ["\n🏆 TOP PERFORMERS", "-" * 60]
     
     # Top products
-    top_products = df.groupby('product_id')['total_amount'].sum().nlargest(5)
-    print("\nTop 5 Products by Revenue:")
-    for i, (product, revenue) in enumerate(top_products.items(), 1):
-        print(f"  {i}. {product}: ${revenue:,.2f}")
+    top_products = bundle.top_products.iloc[:5]
+    lines.append("\nTop 5 Products by Revenue:")
+    lines.extend(
+        f"  {i}. {product}: ${revenue:,.2f}"
+        for i, (product, revenue) in enumerate(top_products.items(), 1)
+    )
     
     # Top sales reps
-    top_reps = df.groupby('sales_rep')['total_amount'].sum().nlargest(5)
-    print("\nTop 5 Sales Representatives:")
-    for i, (rep, revenue) in enumerate(top_reps.items(), 1):
-        print(f"  {i}. {rep}: ${revenue:,.2f}")
+    top_reps = bundle.rep_totals.nlargest(5)
+    lines.append("\nTop 5 Sales Representatives:")
+    lines.extend(
+        f"  {i}. {rep}: ${revenue:,.2f}"
+        for i, (rep, revenue) in enumerate(top_reps.items(), 1)
+    )
     
     # Payment method analysis
-    print("\n💳 PAYMENT METHOD ANALYSIS")
-    print("-" * 60)
-    payment_analysis = df.groupby('payment_method').agg({
-        'total_amount': ['sum', 'count']
-    })
-    payment_analysis.columns = ['Total_Revenue', 'Num_Transactions']
-    payment_analysis = payment_analysis.sort_values('Total_Revenue', ascending=False)
-    
-    for method, row in payment_analysis.iterrows():
-        pct = (row['Total_Revenue'] / df['total_amount'].sum() * 100)
-        print(f"{method}: ${row['Total_Revenue']:,.2f} ({pct:.1f}%)")
-    
-    # Time analysis
-    if 'date' in df.columns:
-        df['date'] = pd.to_datetime(df['date'])
-        print("\n📅 TIME ANALYSIS")
-        print("-" * 60)
-        date_range = f"{df['date'].min().date()} to {df['date'].max().date()}"
-        print(f"Date Range: {date_range}")
-        
-        if 'month' in df.columns:
-            monthly = df.groupby('month')['total_amount'].sum()
-            print(f"\nBest Month: Month {monthly.idxmax()} (${monthly.max():,.2f})")
-            print(f"Worst Month: Month {monthly.idxmin()} (${monthly.min():,.2f})")
+    lines += ["\n💳 PAYMENT METHOD ANALYSIS", "-" * 60]
+    lines.extend(
+        f"{row.Index}: ${row.Total_Revenue:,.2f} ({row.Pct:.1f}%)"
+        for row in bundle.payment_agg.itertuples()
+    )
+    
+    # Time analysis (summarize() already needed 'date' as datetime)
+    date_range = f"{df['date'].min().date()} to {df['date'].max().date()}"
+    lines += ["\n📅 TIME ANALYSIS", "-" * 60, f"Date Range: {date_range}"]
     
-    print("\n" + "=" * 60)
-    print("END OF REPORT")
-    print("=" * 60)
+    monthly = bundle.monthly_sum
+    if monthly is not None:
+        lines += [
+            f"\nBest Month: Month {monthly.idxmax()} (${monthly.max():,.2f})",
+            f"Worst Month: Month {monthly.idxmin()} (${monthly.min():,.2f})"
+        ]
+    
+    lines += ["\n" + "=" * 60, "END OF REPORT", "=" * 60]
+    
+    print("\n".join(lines))
 
 # %%
 # Generate report
-generate_sales_report(df_processed)
+report_bundle = summarize(df_processed)
+generate_sales_report(report_bundle)
 
 # %% [markdown]
 # ## 5. Creating Visualizations for Reports
 
 # %%
-def create_sales_dashboard(df, output_file='sales_dashboard.png'):
+def create_sales_dashboard(bundle, output_file='sales_dashboard.png', show=False):
     """
-    Create a visual dashboard for the sales report
+    Create a visual dashboard for the sales report from a ReportBundle
+
+    Set show=True to also display the figure (e.g. in a notebook).
     """
+    df = bundle.df
+    
     fig = plt.figure(figsize=(16, 10))
     gs = fig.add_gridspec(3, 3, hspace=0.3, wspace=0.3)
     
     # Plot 1: Revenue by Region (Bar)
     ax1 = fig.add_subplot(gs[0, :2])
-    region_sales = df.groupby('region')['total_amount'].sum().sort_values(ascending=False)
+    region_sales = bundle.region_agg['Total_Revenue']
     ax1.bar(region_sales.index, region_sales.values, color='#2E86AB')
     ax1.set_title('Total Revenue by Region', fontsize=14, fontweight='bold')
     ax1.set_ylabel('Revenue ($)')
@@ -330,23 +405,23 @@ def create_sales_dashboard(df, output_file='sales_dashboard.png'):
 KEY METRICS
 
 Total Revenue:
-${df['total_amount'].sum():,.0f}
+${bundle.total_rev:,.0f}
 
 Avg Transaction:
-${df['total_amount'].mean():,.0f}
+${bundle.mean_txn:,.0f}
 
 Total Transactions:
 {len(df):,}
 
 Unique Customers:
-{df['customer_id'].nunique():,}
+{bundle.n_customers:,}
 """
     ax2.text(0.1, 0.5, metrics_text, fontsize=12, verticalalignment='center',
              bbox=dict(boxstyle='round', facecolor='#F0F0F0', alpha=0.8))
     
     # Plot 3: Payment Methods (Pie)
     ax3 = fig.add_subplot(gs[1, 0])
-    payment_counts = df['payment_method'].value_counts()
+    payment_counts = bundle.payment_agg['Num_Transactions'].sort_values(ascending=False)
     colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A', '#98D8C8']
     ax3.pie(payment_counts.values, labels=payment_counts.index, autopct='%1.0f%%',
             colors=colors, textprops={'fontsize': 9})
@@ -354,7 +429,7 @@ Unique Customers:
     
     # Plot 4: Sales Trend (Line)
     ax4 = fig.add_subplot(gs[1, 1:])
-    daily_sales = df.groupby('date')['total_amount'].sum().sort_index()
+    daily_sales = bundle.daily_sum
     ax4.plot(daily_sales.index, daily_sales.values, linewidth=2, color='#2ECC71')
     ax4.set_title('Daily Sales Trend', fontsize=12, fontweight='bold')
     ax4.set_ylabel('Sales ($)')
@@ -363,7 +438,7 @@ Unique Customers:
     
     # Plot 5: Top Products (Horizontal Bar)
     ax5 = fig.add_subplot(gs[2, :2])
-    top_products = df.groupby('product_id')['total_amount'].sum().nlargest(10)
+    top_products = bundle.top_products
     ax5.barh(range(len(top_products)), top_products.values, color='coral')
     ax5.set_yticks(range(len(top_products)))
     ax5.set_yticklabels(top_products.index)
@@ -374,7 +449,7 @@ Unique Customers:
     # Plot 6: Sales Distribution (Histogram)
     ax6 = fig.add_subplot(gs[2, 2])
     ax6.hist(df['total_amount'], bins=30, color='#9B59B6', edgecolor='black', alpha=0.7)
-    ax6.axvline(df['total_amount'].mean(), color='red', linestyle='--', linewidth=2)
+    ax6.axvline(bundle.mean_txn, color='red', linestyle='--', linewidth=2)
     ax6.set_xlabel('Amount ($)')
     ax6.set_ylabel('Frequency')
     ax6.set_title('Transaction Distribution', fontsize=12, fontweight='bold')
@@ -382,14 +457,19 @@ Unique Customers:
     plt.suptitle(f'SALES DASHBOARD - {datetime.now().strftime("%Y-%m-%d")}',
                  fontsize=18, fontweight='bold', y=0.98)
     
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    # 150 dpi is plenty for a report image and renders 4x fewer pixels than 300
+    fig.savefig(output_file, dpi=150, bbox_inches='tight')
     print(f"Dashboard saved to: {output_file}")
     
-    plt.show()
+    if show:
+        plt.show()
+    
+    # Free the figure's memory once it has been saved
+    plt.close(fig)
 
 # %%
 # Create dashboard
-create_sales_dashboard(df_processed)
+create_sales_dashboard(report_bundle, show=True)
 
 # %% [markdown]
 # ## 6. Complete Automated Report Pipeline
@@ -410,6 +490,7 @@ def automated_report_pipeline(data_file, report_name='Daily_Sales_Report'):
         print("\n[1/4] Loading and processing data...")
         df = pd.read_csv(data_file, parse_dates=['date'])
         df = transform_sales_data(df)
+        bundle = summarize(df)
         print(f"     ✓ Processed {len(df)} records")
         
         # Step 2: Generate text report
@@ -417,18 +498,17 @@ def automated_report_pipeline(data_file, report_name='Daily_Sales_Report'):
         report_file = f'{report_name}_{timestamp}.txt'
         
         # Redirect print output to file
-        import sys
         original_stdout = sys.stdout
         with open(report_file, 'w') as f:
             sys.stdout = f
-            generate_sales_report(df)
+            generate_sales_report(bundle)
         sys.stdout = original_stdout
         print(f"     ✓ Report saved to: {report_file}")
         
         # Step 3: Generate visualizations
         print("\n[3/4] Creating dashboard...")
         dashboard_file = f'{report_name}_Dashboard_{timestamp}.png'
-        create_sales_dashboard(df, dashboard_file)
+        create_sales_dashboard(bundle, dashboard_file)
         print(f"     ✓ Dashboard saved to: {dashboard_file}")
         
         # Step 4: Export processed data
@@ -508,21 +588,45 @@ def automated_report_pipeline(data_file, report_name='Daily_Sales_Report'):
 
 # %%
 import logging
+import logging.handlers
+import queue
+import atexit
 from datetime import datetime
 
+# Logger shared by every pipeline run (created on the first setup_logging call)
+_LOGGER = None
+
 def setup_logging(log_file='pipeline.log'):
     """
     Set up logging for the pipeline
+    
+    Handlers are only added once, so running the pipeline again doesn't
+    duplicate every log line. The pipeline only puts records on a queue;
+    a background thread writes them to the log file and the console.
     """
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler()
-        ]
-    )
-    return logging.getlogger(__name__)
+    global _LOGGER
+    if _LOGGER is not None:
+        return _LOGGER
+    
+    logger = logging.getLogger(__name__)
+    if not logger.handlers:
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(formatter)
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        
+        log_queue = queue.Queue()
+        listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+        listener.start()
+        # Flush any queued records when Python exits
+        atexit.register(listener.stop)
+        
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    
+    _LOGGER = logger
+    return logger
 
 def robust_etl_pipeline(input_file, output_file):
     """
@@ -604,20 +708,36 @@ config = {
 def load_config(config_file='config.json'):
     """
     Load configuration from JSON file
+    
+    Uses orjson (much faster, written in Rust) when it is installed.
     """
-    import json
     if os.path.exists(config_file):
-        with open(config_file, 'r') as f:
-            return json.load(f)
+        try:
+            import orjson
+        except ImportError:
+            import json
+            with open(config_file, 'r') as f:
+                return json.load(f)
+        with open(config_file, 'rb') as f:
+            return orjson.loads(f.read())
     return config
 
 def save_config(config, config_file='config.json'):
     """
     Save configuration to JSON file
+    
+    Uses orjson (much faster, written in Rust) when it is installed.
     """
-    import json
-    with open(config_file, 'w') as f:
-        json.dump(config, f, indent=4)
+    try:
+        import orjson
+    except ImportError:
+        import json
+        with open(config_file, 'w') as f:
+            json.dump(config, f, indent=2)
+    else:
+        # orjson returns bytes, written in a single call
+        with open(config_file, 'wb') as f:
+            f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
     print(f"Configuration saved to {config_file}")
 
 # Example usage
@@ -704,17 +824,18 @@ def main():
         # Process data
         print("\n[2/4] Processing data...")
         df = transform_sales_data(df)
+        bundle = summarize(df)
         print(f"      ✓ Processed successfully")
         
         # Generate report
         print("\n[3/4] Generating report...")
-        generate_sales_report(df)
+        generate_sales_report(bundle)
         print(f"      ✓ Report generated")
         
         # Create visualization
         print("\n[4/4] Creating visualizations...")
         dashboard_file = f'{OUTPUT_DIR}dashboard_{timestamp}.png'
-        create_sales_dashboard(df, dashboard_file)
+        create_sales_dashboard(bundle, dashboard_file)
         print(f"      ✓ Dashboard saved")
         
         print(f"\n{'='*70}")
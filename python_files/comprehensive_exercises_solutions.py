@@ -7,6 +7,7 @@
 # %%
 import pandas as pd
 import numpy as np
+import os
 import matplotlib.pyplot as plt
 import seaborn as sns
 
@@ -20,12 +21,13 @@ print("✓ Libraries imported successfully!")
 # %%
 monthly_revenue = [18000, 22000, 19500, 25000, 21000, 23500, 26000, 24000, 22500, 27000, 29000, 31000]
 
-# Calculate statistics
-total_revenue = sum(monthly_revenue)
-average_revenue = total_revenue / len(monthly_revenue)
-highest_month = max(monthly_revenue)
-lowest_month = min(monthly_revenue)
-months_over_20k = len([rev for rev in monthly_revenue if rev > 20000])
+# Calculate statistics on a NumPy array (vectorized, no temporary lists)
+rev = np.asarray(monthly_revenue)
+total_revenue = int(rev.sum())
+average_revenue = float(rev.mean())
+highest_month = int(rev.max())
+lowest_month = int(rev.min())
+months_over_20k = int((rev > 20000).sum())
 
 print(f"Total Revenue: ${total_revenue:,}")
 print(f"Average Monthly Revenue: ${average_revenue:,.2f}")
@@ -55,8 +57,33 @@ print(f"Total Value: ${total_value:,.2f}")
 # ## Exercise 2: Loading and Exploring Data (10 points)
 
 # %%
-# Load the data
-df_sales = pd.read_csv('../datasets/sales_data.csv', parse_dates=['date'])
+# Load the data (only the columns the exercises use, so the rest isn't parsed)
+SALES_COLS = ['date', 'total_amount', 'region', 'payment_method', 'customer_id',
+              'sales_rep', 'transaction_id']
+# Low-cardinality text columns are read as 'category': groupby/value_counts then
+# work on small integer codes instead of hashing strings. total_amount stays
+# float64 - float32 sums would be off by a few cents.
+SALES_DTYPES = {'region': 'category', 'payment_method': 'category', 'sales_rep': 'category'}
+
+# Prefer the Feather copy written by generate_datasets.py (when pyarrow is
+# installed): it loads without parsing any text. It is only used when it's at
+# least as new as the CSV, so an updated CSV (e.g. after a git pull) wins.
+SALES_CSV = '../datasets/sales_data.csv'
+SALES_FEATHER = '../datasets/sales_data.feather'
+if (os.path.exists(SALES_FEATHER)
+        and os.path.getmtime(SALES_FEATHER) >= os.path.getmtime(SALES_CSV)):
+    df_sales = pd.read_feather(SALES_FEATHER, columns=SALES_COLS).astype(SALES_DTYPES)
+else:
+    df_sales = pd.read_csv(SALES_CSV, usecols=SALES_COLS, dtype=SALES_DTYPES,
+                           parse_dates=['date'])
+
+# Aggregations reused by several exercises and the dashboard: compute each once
+# (sort=False skips sorting the group keys; we sort the results where needed)
+AGG = {
+    'region_sum': df_sales.groupby('region', sort=False, observed=True)['total_amount'].sum(),
+    'daily_sum': df_sales.groupby('date', sort=False)['total_amount'].sum().sort_index(),
+    'payment_counts': df_sales['payment_method'].value_counts()
+}
 
 # 1. How many transactions?
 print(f"1. Total transactions: {len(df_sales):,}")
@@ -68,10 +95,10 @@ print(f"2. Date range: {df_sales['date'].min().date()} to {df_sales['date'].max(
 print(f"3. Unique customers: {df_sales['customer_id'].nunique():,}")
 
 # 4. Top 3 payment methods
-top_payment = df_sales['payment_method'].value_counts().head(3)
+top_payment = AGG['payment_counts'].head(3)
 print("\n4. Top 3 payment methods:")
-for method, count in top_payment.items():
-    print(f"   {method}: {count:,} transactions")
+# Join the lines and print once, instead of one print() per item
+print("\n".join(f"   {method}: {count:,} transactions" for method, count in top_payment.items()))
 
 # %% [markdown]
 # ## Exercise 3: Filtering and Selection (15 points)
@@ -84,13 +111,23 @@ print(high_value[['transaction_id', 'total_amount', 'region']].head())
 
 # %%
 # 2. Transactions from North or South
-north_south = df_sales[df_sales['region'].isin(['North', 'South'])]
+# region is a category, so compare its integer codes rather than the strings
+# (same result as df_sales['region'].isin(['North', 'South']))
+region_codes = df_sales['region'].cat.codes.to_numpy()
+
+def in_regions(*labels):
+    """Mask of rows whose region is one of `labels` (unknown labels match nothing)"""
+    codes = df_sales['region'].cat.categories.get_indexer(labels)  # -1 if missing
+    return np.isin(region_codes, codes[codes >= 0])
+
+north_south = df_sales[in_regions('North', 'South')]
 print(f"\n2. Transactions from North or South: {len(north_south):,}")
 print(north_south[['transaction_id', 'region', 'total_amount']].head())
 
 # %%
 # 3. Transactions over $1,000 AND from East
-east_high = df_sales[(df_sales['total_amount'] > 1000) & (df_sales['region'] == 'East')]
+east_high = df_sales[(df_sales['total_amount'].to_numpy() > 1000) &
+                     in_regions('East')]
 print(f"\n3. East region transactions over $1,000: {len(east_high):,}")
 print(east_high[['transaction_id', 'region', 'total_amount']].head())
 
@@ -105,28 +142,25 @@ print(selected.head(10))
 
 # %%
 # 1. Total sales by region
-region_totals = df_sales.groupby('region')['total_amount'].sum().sort_values(ascending=False)
+region_totals = AGG['region_sum'].sort_values(ascending=False)
 print("1. Total sales by region:")
-for region, total in region_totals.items():
-    print(f"   {region}: ${total:,.2f}")
+print("\n".join(f"   {region}: ${total:,.2f}" for region, total in region_totals.items()))
 
 # %%
 # 2. Average transaction by payment method
-payment_avg = df_sales.groupby('payment_method')['total_amount'].mean().sort_values(ascending=False)
+payment_avg = df_sales.groupby('payment_method', observed=True)['total_amount'].mean().sort_values(ascending=False)
 print("\n2. Average transaction by payment method:")
-for method, avg in payment_avg.items():
-    print(f"   {method}: ${avg:,.2f}")
+print("\n".join(f"   {method}: ${avg:,.2f}" for method, avg in payment_avg.items()))
 
 # %%
 # 3. Transactions per sales rep
-rep_counts = df_sales.groupby('sales_rep').size().sort_values(ascending=False)
+rep_counts = df_sales.groupby('sales_rep', observed=True).size().sort_values(ascending=False)
 print("\n3. Transactions per sales representative:")
-for rep, count in rep_counts.items():
-    print(f"   {rep}: {count:,} transactions")
+print("\n".join(f"   {rep}: {count:,} transactions" for rep, count in rep_counts.items()))
 
 # %%
 # 4. Summary by region
-region_summary = df_sales.groupby('region')['total_amount'].agg([
+region_summary = df_sales.groupby('region', observed=True)['total_amount'].agg([
     ('Total_Sales', 'sum'),
     ('Avg_Sale', 'mean'),
     ('Transaction_Count', 'count')
@@ -141,7 +175,7 @@ print(region_summary)
 # %%
 # 1. Bar chart: Total sales by region
 plt.figure(figsize=(10, 6))
-region_totals = df_sales.groupby('region')['total_amount'].sum().sort_values(ascending=False)
+region_totals = AGG['region_sum'].sort_values(ascending=False)
 plt.bar(region_totals.index, region_totals.values, color='steelblue')
 plt.title('Total Sales by Region', fontsize=14, fontweight='bold')
 plt.xlabel('Region')
@@ -154,7 +188,7 @@ plt.show()
 # %%
 # 2. Line chart: Daily sales trend
 plt.figure(figsize=(14, 6))
-daily_sales = df_sales.groupby('date')['total_amount'].sum().sort_index()
+daily_sales = AGG['daily_sum']
 plt.plot(daily_sales.index, daily_sales.values, linewidth=2, color='green')
 plt.title('Daily Sales Trend', fontsize=14, fontweight='bold')
 plt.xlabel('Date')
@@ -167,7 +201,7 @@ plt.show()
 # %%
 # 3. Pie chart: Payment method distribution
 plt.figure(figsize=(10, 8))
-payment_counts = df_sales['payment_method'].value_counts()
+payment_counts = AGG['payment_counts']
 colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A', '#98D8C8']
 plt.pie(payment_counts.values, labels=payment_counts.index, autopct='%1.1f%%',
         startangle=90, colors=colors)
@@ -195,32 +229,34 @@ plt.show()
 
 # %%
 # 1. Load customer data
-df_customers = pd.read_csv('../datasets/customer_data.csv', parse_dates=['signup_date'])
+df_customers = pd.read_csv(
+    '../datasets/customer_data.csv',
+    dtype={'customer_segment': 'category', 'city': 'category', 'state': 'category'},
+    parse_dates=['signup_date']
+)
 
 # 2. Merge with sales
-df_merged = pd.merge(
-    df_sales,
-    df_customers[['customer_id', 'customer_segment', 'city', 'state']],
-    on='customer_id',
-    how='left'
-)
+# Index the customers by customer_id and join on it: a left join that looks
+# each sale's customer up in the index and only brings in the 3 columns we need
+cust_idx = df_customers.set_index('customer_id')[['customer_segment', 'city', 'state']]
+df_merged = df_sales.join(cust_idx, on='customer_id')
 
 print("Merged data sample:")
 print(df_merged[['transaction_id', 'customer_id', 'customer_segment', 'total_amount']].head(10))
 
 # %%
 # 3. Total sales by customer segment
-segment_sales = df_merged.groupby('customer_segment')['total_amount'].sum().sort_values(ascending=False)
+segment_sales = df_merged.groupby('customer_segment', sort=False, observed=True)['total_amount'].sum().sort_values(ascending=False)
 print("\nTotal sales by customer segment:")
-for segment, total in segment_sales.items():
-    print(f"  {segment}: ${total:,.2f}")
+print("\n".join(f"  {segment}: ${total:,.2f}" for segment, total in segment_sales.items()))
 
 # %%
 # 4. Top 5 customers by total purchase amount
-top_customers = df_merged.groupby('customer_id').agg({
-    'total_amount': 'sum',
-    'transaction_id': 'count'
-}).sort_values('total_amount', ascending=False).head(5)
+top_customers = (
+    df_merged.groupby('customer_id', sort=False)['total_amount']
+    .agg(['sum', 'size'])
+    .nlargest(5, 'sum')
+)
 top_customers.columns = ['Total_Purchased', 'Num_Transactions']
 
 print("\nTop 5 customers by total purchase amount:")
@@ -230,8 +266,10 @@ print(top_customers)
 # ## Exercise 7: Data Cleaning (20 points)
 
 # %%
-# Load survey data
-df_survey = pd.read_csv('../datasets/survey_results.csv', parse_dates=['submission_date'])
+# Load survey data (only the columns we clean)
+SURVEY_COLS = ['submission_date', 'satisfaction_score', 'age_group', 'would_recommend']
+df_survey = pd.read_csv('../datasets/survey_results.csv', usecols=SURVEY_COLS,
+                        parse_dates=['submission_date'])
 
 print("BEFORE CLEANING:")
 print(f"Total rows: {len(df_survey)}")
@@ -239,18 +277,17 @@ print("\nMissing values per column:")
 print(df_survey.isnull().sum())
 
 # %%
-# Make a copy for cleaning
-df_survey_clean = df_survey.copy()
+# Median of all responses (taken before any rows are removed)
+median_score = df_survey['satisfaction_score'].median()
 
+# Clean in one chain (.loc[] returns a new DataFrame, so no copy() is needed):
+# 4. Remove rows where would_recommend is missing (first, so fewer values to fill)
 # 2. Fill missing satisfaction_score with median
-median_score = df_survey_clean['satisfaction_score'].median()
-df_survey_clean['satisfaction_score'] = df_survey_clean['satisfaction_score'].fillna(median_score)
-
 # 3. Fill missing age_group
-df_survey_clean['age_group'] = df_survey_clean['age_group'].fillna('Not specified')
-
-# 4. Remove rows where would_recommend is missing
-df_survey_clean = df_survey_clean.dropna(subset=['would_recommend'])
+df_survey_clean = df_survey.loc[df_survey['would_recommend'].notna()].assign(
+    satisfaction_score=lambda d: d['satisfaction_score'].fillna(median_score),
+    age_group=lambda d: d['age_group'].fillna('Not specified')
+)
 
 print("\nAFTER CLEANING:")
 print(f"Total rows: {len(df_survey_clean)}")
@@ -268,9 +305,13 @@ print(f"Rows removed: {len(df_survey) - len(df_survey_clean):,} ({(1 - len(df_su
 # ## Exercise 8: Date/Time Analysis (15 points)
 
 # %%
-# 1. Extract month and day_of_week
-df_sales['month'] = df_sales['date'].dt.month
-df_sales['day_of_week'] = df_sales['date'].dt.day_name()
+# 1. Extract month and day_of_week (plus quarter, used in Exercise 9)
+# Use the .dt accessor once; store small ints and an ordered day category
+day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+dt = df_sales['date'].dt
+df_sales['month'] = dt.month.astype('int8')
+df_sales['quarter'] = dt.quarter.astype('int8')
+df_sales['day_of_week'] = pd.Categorical.from_codes(dt.dayofweek, categories=day_order, ordered=True)
 
 print("Date components added:")
 print(df_sales[['date', 'month', 'day_of_week']].head(10))
@@ -279,17 +320,16 @@ print(df_sales[['date', 'month', 'day_of_week']].head(10))
 # 2. Total sales by month
 monthly_sales = df_sales.groupby('month')['total_amount'].sum().sort_index()
 print("\nTotal sales by month:")
-for month, total in monthly_sales.items():
-    print(f"  Month {month}: ${total:,.2f}")
+print("\n".join(f"  Month {month}: ${total:,.2f}" for month, total in monthly_sales.items()))
 
 # %%
 # 3. Average sales by day of week
-day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-weekly_pattern = df_sales.groupby('day_of_week')['total_amount'].mean().reindex(day_order)
+# day_of_week is an ordered category, so the result is already Monday..Sunday
+# (observed=False keeps every day, like reindex(day_order) would)
+weekly_pattern = df_sales.groupby('day_of_week', observed=False)['total_amount'].mean()
 
 print("\nAverage sales by day of week:")
-for day, avg in weekly_pattern.items():
-    print(f"  {day}: ${avg:,.2f}")
+print("\n".join(f"  {day}: ${avg:,.2f}" for day, avg in weekly_pattern.items()))
 
 # %%
 # 4. Visualize monthly sales
@@ -308,41 +348,38 @@ plt.show()
 
 # %%
 # 1. Sales by region and payment method
-pivot1 = df_sales.pivot_table(
-    values='total_amount',
-    index='region',
-    columns='payment_method',
-    aggfunc='sum',
-    fill_value=0
-).round(2)
+# groupby + unstack builds the same table as
+# pivot_table(values=..., index=..., columns=..., aggfunc=..., fill_value=0)
+# without pivot_table's extra overhead
+pivot1 = (
+    df_sales.groupby(['region', 'payment_method'], observed=True)['total_amount']
+    .sum()
+    .unstack(fill_value=0)
+    .round(2)
+)
 
 print("1. Sales amount by region and payment method:")
 print(pivot1)
 
 # %%
 # 2. Transaction count by sales rep and region
-pivot2 = df_sales.pivot_table(
-    values='transaction_id',
-    index='sales_rep',
-    columns='region',
-    aggfunc='count',
-    fill_value=0
+pivot2 = (
+    df_sales.groupby(['sales_rep', 'region'], observed=True)['transaction_id']
+    .count()
+    .unstack(fill_value=0)
 )
 
 print("\n2. Transaction count by sales rep and region:")
 print(pivot2)
 
 # %%
-# 3. Average transaction by quarter and region
-df_sales['quarter'] = df_sales['date'].dt.quarter
-
-pivot3 = df_sales.pivot_table(
-    values='total_amount',
-    index='quarter',
-    columns='region',
-    aggfunc='mean',
-    fill_value=0
-).round(2)
+# 3. Average transaction by quarter and region (quarter was added in Exercise 8)
+pivot3 = (
+    df_sales.groupby(['quarter', 'region'], observed=True)['total_amount']
+    .mean()
+    .unstack(fill_value=0)
+    .round(2)
+)
 
 print("\n3. Average transaction amount by quarter and region:")
 print(pivot3)
@@ -353,34 +390,47 @@ print(pivot3)
 # %%
 # Which sales representatives are performing best, and in which regions?
 
+# Compute total, average and count per rep in a single groupby pass
+rep_stats = df_sales.groupby('sales_rep', observed=True)['total_amount'].agg(['sum', 'mean', 'count'])
+
 # 1. Total sales per rep
-rep_totals = df_sales.groupby('sales_rep')['total_amount'].sum().sort_values(ascending=False)
+rep_totals = rep_stats['sum'].sort_values(ascending=False)
 print("1. Total sales per sales representative:")
-for rep, total in rep_totals.items():
-    print(f"   {rep}: ${total:,.2f}")
+print("\n".join(f"   {rep}: ${total:,.2f}" for rep, total in rep_totals.items()))
 
 # %%
 # 2. Average transaction size per rep
-rep_avg = df_sales.groupby('sales_rep')['total_amount'].mean().sort_values(ascending=False)
+rep_avg = rep_stats['mean'].sort_values(ascending=False)
 print("\n2. Average transaction size per sales representative:")
-for rep, avg in rep_avg.items():
-    print(f"   {rep}: ${avg:,.2f}")
+print("\n".join(f"   {rep}: ${avg:,.2f}" for rep, avg in rep_avg.items()))
 
 # %%
 # 3. Number of transactions per rep
-rep_count = df_sales.groupby('sales_rep').size().sort_values(ascending=False)
+rep_count = rep_stats['count'].sort_values(ascending=False)
 print("\n3. Number of transactions per sales representative:")
-for rep, count in rep_count.items():
-    print(f"   {rep}: {count:,} transactions")
+print("\n".join(f"   {rep}: {count:,} transactions" for rep, count in rep_count.items()))
 
 # %%
 # 4. Breakdown by region
-rep_region_breakdown = df_sales.pivot_table(
-    values='total_amount',
-    index='sales_rep',
-    columns='region',
-    aggfunc='sum',
-    fill_value=0
+# Same table as a groupby(['sales_rep', 'region']).sum().unstack(), but built
+# from the category codes in a single NumPy pass, which stays fast on much
+# bigger data: each (rep, region) pair gets one slot in a flat array and
+# np.bincount adds every sale's amount into its slot
+reps = df_sales['sales_rep'].cat.categories
+regions = df_sales['region'].cat.categories
+# Codes are int8 - widen them before multiplying so the slots can't overflow
+rep_ids = df_sales['sales_rep'].cat.codes.to_numpy().astype(np.intp)
+region_ids = df_sales['region'].cat.codes.to_numpy().astype(np.intp)
+# A missing rep or region has code -1: leave those sales out, like pivot_table
+known = (rep_ids >= 0) & (region_ids >= 0)
+slot = rep_ids[known] * len(regions) + region_ids[known]
+rep_region_sums = np.bincount(slot, weights=df_sales['total_amount'].to_numpy()[known],
+                              minlength=len(reps) * len(regions))
+
+rep_region_breakdown = pd.DataFrame(
+    rep_region_sums.reshape(len(reps), len(regions)),
+    index=pd.Index(reps, name='sales_rep'),
+    columns=pd.Index(regions, name='region')
 ).round(2)
 
 print("\n4. Sales by rep and region:")
@@ -409,6 +459,12 @@ plt.show()
 
 # %%
 # Create a professional dashboard
+
+# Headline numbers: one agg call per column instead of a separate pass for each
+amount_stats = df_sales['total_amount'].agg(['sum', 'mean', 'count'])
+date_min, date_max = df_sales['date'].agg(['min', 'max'])
+n_customers = df_sales['customer_id'].nunique()
+
 fig = plt.figure(figsize=(16, 10))
 gs = fig.add_gridspec(3, 3, hspace=0.3, wspace=0.3)
 
@@ -419,20 +475,20 @@ metrics_text = f"""
 KEY METRICS
 
 Total Revenue:
-${df_sales['total_amount'].sum():,.0f}
+${amount_stats['sum']:,.0f}
 
 Avg Transaction:
-${df_sales['total_amount'].mean():,.0f}
+${amount_stats['mean']:,.0f}
 
 Total Transactions:
-{len(df_sales):,}
+{int(amount_stats['count']):,}
 
 Unique Customers:
-{df_sales['customer_id'].nunique():,}
+{n_customers:,}
 
 Date Range:
-{df_sales['date'].min().date()}
-to {df_sales['date'].max().date()}
+{date_min.date()}
+to {date_max.date()}
 """
 ax1.text(0.1, 0.5, metrics_text, fontsize=11, verticalalignment='center',
          bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
@@ -440,7 +496,7 @@ ax1.set_title('Overview', fontsize=12, fontweight='bold', loc='left')
 
 # Plot 2: Sales by region
 ax2 = fig.add_subplot(gs[0, 1:])
-region_sales = df_sales.groupby('region')['total_amount'].sum().sort_values(ascending=False)
+region_sales = AGG['region_sum'].sort_values(ascending=False)
 ax2.bar(region_sales.index, region_sales.values, color='#2E86AB')
 ax2.set_title('Sales by Region', fontsize=12, fontweight='bold')
 ax2.set_ylabel('Total Sales ($)')
@@ -449,8 +505,8 @@ ax2.tick_params(axis='x', rotation=45)
 
 # Plot 3: Sales trend
 ax3 = fig.add_subplot(gs[1, :])
-daily_sales = df_sales.groupby('date')['total_amount'].sum().sort_index()
-ax3.plot(daily_sales.index, daily_sales.values, linewidth=2, color='#2ECC71')
+daily_sales = AGG['daily_sum']
+ax3.plot(daily_sales.index, daily_sales.values, linewidth=2, color='#2ECC71', rasterized=True)
 ax3.set_title('Daily Sales Trend', fontsize=12, fontweight='bold')
 ax3.set_ylabel('Sales ($)')
 ax3.tick_params(axis='x', rotation=45)
@@ -458,7 +514,7 @@ ax3.grid(True, alpha=0.3)
 
 # Plot 4: Payment methods
 ax4 = fig.add_subplot(gs[2, :2])
-payment_counts = df_sales['payment_method'].value_counts()
+payment_counts = AGG['payment_counts']
 colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A', '#98D8C8']
 ax4.pie(payment_counts.values, labels=payment_counts.index, autopct='%1.1f%%',
         colors=colors, textprops={'fontsize': 9})
@@ -467,14 +523,16 @@ ax4.set_title('Payment Methods', fontsize=12, fontweight='bold')
 # Plot 5: Transaction distribution
 ax5 = fig.add_subplot(gs[2, 2])
 ax5.hist(df_sales['total_amount'], bins=30, color='coral', edgecolor='black', alpha=0.7)
-ax5.axvline(df_sales['total_amount'].mean(), color='red', linestyle='--', linewidth=2)
+ax5.axvline(amount_stats['mean'], color='red', linestyle='--', linewidth=2)
 ax5.set_xlabel('Amount ($)')
 ax5.set_ylabel('Frequency')
 ax5.set_title('Transaction Distribution', fontsize=12, fontweight='bold')
 ax5.tick_params(axis='x', rotation=45)
 
 plt.suptitle('SALES DASHBOARD', fontsize=18, fontweight='bold', y=0.98)
-plt.savefig('sales_dashboard.png', dpi=300, bbox_inches='tight')
+# 16x10 inches at 150 dpi is already a 2400x1500 image
+fig.savefig('sales_dashboard.png', dpi=150, bbox_inches='tight',
+            metadata={'Software': 'pandas-course'})
 plt.show()
 
 print("✓ Dashboard saved as 'sales_dashboard.png'")
@@ -530,7 +588,7 @@ def generate_sales_summary(df):
         if 'region' in df.columns:
             report += "\n🌍 REGIONAL BREAKDOWN\n"
             report += "-" * 50 + "\n"
-            regional = df.groupby('region')['total_amount'].agg(['sum', 'count'])
+            regional = df.groupby('region', observed=True)['total_amount'].agg(['sum', 'count'])
             for region, row in regional.iterrows():
                 report += f"{region:12s}: ${row['sum']:>12,.2f} ({int(row['count']):>4,} txns)\n"
         
@@ -1,14 +1,58 @@
 """
 Script to generate sample datasets for Python Data Analysis course
 """
+import os
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-import random
+from datetime import datetime
+from functools import reduce
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:  # optional: only needed for the Parquet/Feather copies
+    pa = None
+
+# One seeded generator for every random column (reproducible, and each call
+# draws a whole column at once)
+rng = np.random.default_rng(42)
+
+
+def concat(*parts):
+    """Element-wise string concatenation of NumPy arrays and/or plain strings"""
+    return reduce(np.char.add, parts)
+
+
+def make_ids(prefix, numbers, width):
+    """Build IDs such as 'TXN000001' from an array of integers"""
+    return concat(prefix, np.char.zfill(numbers.astype(str), width))
+
+
+def sort_by(df, column):
+    """Reorder rows by one column using a stable NumPy permutation"""
+    order = np.argsort(df[column].values, kind='stable')
+    return df.take(order).reset_index(drop=True)
+
+
+def save_dataset(df, name):
+    """
+    Write datasets/<name>.csv, plus Parquet and Feather (Arrow IPC) copies
+    when pyarrow is installed - these reload without any CSV parsing
+    """
+    df.to_csv(f'datasets/{name}.csv', index=False)
+    if pa is not None:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pq.write_table(table, f'datasets/{name}.parquet', compression='zstd')
+        feather.write_feather(table, f'datasets/{name}.feather', compression='zstd')
+    else:
+        # Copies left over from an earlier run no longer match the new CSV
+        for ext in ('parquet', 'feather'):
+            try:
+                os.remove(f'datasets/{name}.{ext}')
+            except FileNotFoundError:
+                pass
 
-# Set random seed for reproducibility
-np.random.seed(42)
-random.seed(42)
 
 # =====================================
 # 1. Sales Data
@@ -19,23 +63,27 @@ n_sales = 1000
 start_date = datetime(2024, 1, 1)
 
 sales_data = {
-    'transaction_id': [f'TXN{str(i).zfill(6)}' for i in range(1, n_sales + 1)],
-    'date': [start_date + timedelta(days=random.randint(0, 270)) for _ in range(n_sales)],
-    'product_id': [f'PRD{random.randint(1, 50):03d}' for _ in range(n_sales)],
-    'customer_id': [f'CUST{random.randint(1, 200):04d}' for _ in range(n_sales)],
-    'quantity': np.random.randint(1, 10, n_sales),
-    'unit_price': np.round(np.random.uniform(10, 500, n_sales), 2),
-    'region': np.random.choice(['North', 'South', 'East', 'West', 'Central'], n_sales),
-    'sales_rep': np.random.choice(['John Smith', 'Mary Johnson', 'David Lee', 'Sarah Wilson', 
-                                    'Michael Brown', 'Jennifer Davis', 'Robert Garcia', 'Lisa Martinez'], n_sales),
-    'payment_method': np.random.choice(['Credit Card', 'Cash', 'Debit Card', 'PayPal', 'Wire Transfer'], 
-                                       n_sales, p=[0.4, 0.2, 0.25, 0.1, 0.05])
+    'transaction_id': make_ids('TXN', np.arange(1, n_sales + 1), 6),
+    'date': start_date + pd.to_timedelta(rng.integers(0, 271, n_sales), unit='D'),
+    'product_id': make_ids('PRD', rng.integers(1, 51, n_sales), 3),
+    'customer_id': make_ids('CUST', rng.integers(1, 201, n_sales), 4),
+    'quantity': rng.integers(1, 10, n_sales, dtype=np.int8),
+    'unit_price': np.round(rng.uniform(10, 500, n_sales), 2),
+    'region': rng.choice(['North', 'South', 'East', 'West', 'Central'], n_sales),
+    'sales_rep': rng.choice(['John Smith', 'Mary Johnson', 'David Lee', 'Sarah Wilson', 
+                              'Michael Brown', 'Jennifer Davis', 'Robert Garcia', 'Lisa Martinez'], n_sales),
+    'payment_method': rng.choice(['Credit Card', 'Cash', 'Debit Card', 'PayPal', 'Wire Transfer'], 
+                                 n_sales, p=[0.4, 0.2, 0.25, 0.1, 0.05])
 }
-
-df_sales = pd.DataFrame(sales_data)
-df_sales['total_amount'] = df_sales['quantity'] * df_sales['unit_price']
-df_sales = df_sales.sort_values('date').reset_index(drop=True)
-df_sales.to_csv('datasets/sales_data.csv', index=False)
+# Multiply the raw NumPy arrays (no pandas index alignment)
+sales_data['total_amount'] = np.multiply(sales_data['quantity'], sales_data['unit_price'])
+
+# Store the low-cardinality text columns as categories (kept by the Parquet copy)
+df_sales = pd.DataFrame(sales_data).astype(
+    {'region': 'category', 'sales_rep': 'category', 'payment_method': 'category'}
+)
+df_sales = sort_by(df_sales, 'date')
+save_dataset(df_sales, 'sales_data')
 print(f"  Created {len(df_sales)} sales records")
 
 # =====================================
@@ -52,24 +100,25 @@ last_names = ['Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Mille
               'Thomas', 'Taylor', 'Moore', 'Jackson', 'Martin', 'Lee', 'Thompson', 'White']
 
 customer_data = {
-    'customer_id': [f'CUST{i:04d}' for i in range(1, n_customers + 1)],
-    'first_name': [random.choice(first_names) for _ in range(n_customers)],
-    'last_name': [random.choice(last_names) for _ in range(n_customers)],
-    'email': [f"{random.choice(first_names).lower()}.{random.choice(last_names).lower()}@email.com" 
-              for _ in range(n_customers)],
-    'phone': [f"({random.randint(200, 999)}) {random.randint(200, 999)}-{random.randint(1000, 9999)}" 
-              for _ in range(n_customers)],
-    'city': np.random.choice(['New York', 'Los Angeles', 'Chicago', 'Houston', 'Phoenix', 
-                              'Philadelphia', 'San Antonio', 'San Diego', 'Dallas', 'San Jose'], n_customers),
-    'state': np.random.choice(['NY', 'CA', 'IL', 'TX', 'AZ', 'PA', 'FL', 'OH', 'NC', 'GA'], n_customers),
-    'signup_date': [start_date - timedelta(days=random.randint(0, 730)) for _ in range(n_customers)],
-    'customer_segment': np.random.choice(['Premium', 'Standard', 'Basic'], n_customers, p=[0.2, 0.5, 0.3]),
-    'total_purchases': np.random.randint(1, 50, n_customers),
-    'lifetime_value': np.round(np.random.uniform(100, 10000, n_customers), 2)
+    'customer_id': make_ids('CUST', np.arange(1, n_customers + 1), 4),
+    'first_name': rng.choice(first_names, n_customers),
+    'last_name': rng.choice(last_names, n_customers),
+    'email': concat(np.char.lower(rng.choice(first_names, n_customers)), '.',
+                    np.char.lower(rng.choice(last_names, n_customers)), '@email.com'),
+    'phone': concat('(', rng.integers(200, 1000, n_customers).astype(str), ') ',
+                    rng.integers(200, 1000, n_customers).astype(str), '-',
+                    rng.integers(1000, 10000, n_customers).astype(str)),
+    'city': rng.choice(['New York', 'Los Angeles', 'Chicago', 'Houston', 'Phoenix', 
+                        'Philadelphia', 'San Antonio', 'San Diego', 'Dallas', 'San Jose'], n_customers),
+    'state': rng.choice(['NY', 'CA', 'IL', 'TX', 'AZ', 'PA', 'FL', 'OH', 'NC', 'GA'], n_customers),
+    'signup_date': start_date - pd.to_timedelta(rng.integers(0, 731, n_customers), unit='D'),
+    'customer_segment': rng.choice(['Premium', 'Standard', 'Basic'], n_customers, p=[0.2, 0.5, 0.3]),
+    'total_purchases': rng.integers(1, 50, n_customers),
+    'lifetime_value': np.round(rng.uniform(100, 10000, n_customers), 2)
 }
 
 df_customers = pd.DataFrame(customer_data)
-df_customers.to_csv('datasets/customer_data.csv', index=False)
+save_dataset(df_customers, 'customer_data')
 print(f"  Created {len(df_customers)} customer records")
 
 # =====================================
@@ -85,30 +134,31 @@ product_categories = {
     'Clothing': ['Men\'s Wear', 'Women\'s Wear', 'Accessories', 'Shoes']
 }
 
-products = []
-product_id = 1
-
-for category, subcategories in product_categories.items():
-    for subcategory in subcategories:
-        for i in range(2):
-            products.append({
-                'product_id': f'PRD{product_id:03d}',
-                'product_name': f'{subcategory} {chr(65+i)}',
-                'category': category,
-                'subcategory': subcategory,
-                'cost_price': round(random.uniform(10, 400), 2),
-                'retail_price': round(random.uniform(15, 500), 2),
-                'stock_quantity': random.randint(0, 500),
-                'supplier': random.choice(['Supplier A', 'Supplier B', 'Supplier C', 'Supplier D']),
-                'weight_kg': round(random.uniform(0.1, 5.0), 2),
-                'is_active': random.choice([True, True, True, False])  # 75% active
-            })
-            product_id += 1
-
-df_products = pd.DataFrame(products)
+# One row per subcategory and variant (A/B): repeat/tile the labels instead of
+# looping, then draw every numeric column in one call
+subcategory_pairs = [(category, subcategory)
+                     for category, subcategories in product_categories.items()
+                     for subcategory in subcategories]
+categories = np.repeat([category for category, _ in subcategory_pairs], 2)
+subcategories = np.repeat([subcategory for _, subcategory in subcategory_pairs], 2)
+variants = np.tile(['A', 'B'], len(subcategory_pairs))
+n_products = len(categories)
+
+df_products = pd.DataFrame({
+    'product_id': make_ids('PRD', np.arange(1, n_products + 1), 3),
+    'product_name': concat(subcategories, ' ', variants),
+    'category': categories,
+    'subcategory': subcategories,
+    'cost_price': np.round(rng.uniform(10, 400, n_products), 2),
+    'retail_price': np.round(rng.uniform(15, 500, n_products), 2),
+    'stock_quantity': rng.integers(0, 501, n_products),
+    'supplier': rng.choice(['Supplier A', 'Supplier B', 'Supplier C', 'Supplier D'], n_products),
+    'weight_kg': np.round(rng.uniform(0.1, 5.0, n_products), 2),
+    'is_active': rng.random(n_products) > 0.25  # 75% active
+})
 df_products['profit_margin'] = ((df_products['retail_price'] - df_products['cost_price']) / 
                                  df_products['retail_price'] * 100).round(2)
-df_products.to_csv('datasets/product_catalog.csv', index=False)
+save_dataset(df_products, 'product_catalog')
 print(f"  Created {len(df_products)} product records")
 
 # =====================================
@@ -123,24 +173,24 @@ pages = ['/home', '/products', '/about', '/contact', '/checkout', '/cart',
          '/product/electronics', '/product/clothing', '/product/sports', '/blog']
 
 web_traffic = {
-    'visit_id': [f'VISIT{i:06d}' for i in range(1, n_visits + 1)],
-    'timestamp': [start_datetime + timedelta(hours=random.randint(0, 6480)) for _ in range(n_visits)],
-    'page_url': np.random.choice(pages, n_visits),
-    'session_duration_sec': np.random.randint(10, 3600, n_visits),
-    'device_type': np.random.choice(['Desktop', 'Mobile', 'Tablet'], n_visits, p=[0.5, 0.4, 0.1]),
-    'browser': np.random.choice(['Chrome', 'Firefox', 'Safari', 'Edge', 'Opera'], 
-                                n_visits, p=[0.5, 0.2, 0.15, 0.1, 0.05]),
-    'traffic_source': np.random.choice(['Organic Search', 'Direct', 'Social Media', 'Email', 'Paid Ads'], 
-                                       n_visits, p=[0.35, 0.25, 0.2, 0.1, 0.1]),
-    'country': np.random.choice(['USA', 'Canada', 'UK', 'Germany', 'France', 'Japan', 'Australia'], n_visits),
-    'bounce': np.random.choice([True, False], n_visits, p=[0.4, 0.6]),
-    'conversion': np.random.choice([True, False], n_visits, p=[0.05, 0.95])
+    'visit_id': make_ids('VISIT', np.arange(1, n_visits + 1), 6),
+    'timestamp': start_datetime + pd.to_timedelta(rng.integers(0, 6481, n_visits), unit='h'),
+    'page_url': rng.choice(pages, n_visits),
+    'session_duration_sec': rng.integers(10, 3600, n_visits),
+    'device_type': rng.choice(['Desktop', 'Mobile', 'Tablet'], n_visits, p=[0.5, 0.4, 0.1]),
+    'browser': rng.choice(['Chrome', 'Firefox', 'Safari', 'Edge', 'Opera'], 
+                          n_visits, p=[0.5, 0.2, 0.15, 0.1, 0.05]),
+    'traffic_source': rng.choice(['Organic Search', 'Direct', 'Social Media', 'Email', 'Paid Ads'], 
+                                 n_visits, p=[0.35, 0.25, 0.2, 0.1, 0.1]),
+    'country': rng.choice(['USA', 'Canada', 'UK', 'Germany', 'France', 'Japan', 'Australia'], n_visits),
+    'bounce': rng.choice([True, False], n_visits, p=[0.4, 0.6]),
+    'conversion': rng.choice([True, False], n_visits, p=[0.05, 0.95])
 }
 
 df_traffic = pd.DataFrame(web_traffic)
-df_traffic['page_views'] = np.random.randint(1, 20, n_visits)
-df_traffic = df_traffic.sort_values('timestamp').reset_index(drop=True)
-df_traffic.to_csv('datasets/web_traffic.csv', index=False)
+df_traffic['page_views'] = rng.integers(1, 20, n_visits)
+df_traffic = sort_by(df_traffic, 'timestamp')
+save_dataset(df_traffic, 'web_traffic')
 print(f"  Created {len(df_traffic)} web visit records")
 
 # =====================================
@@ -149,32 +199,33 @@ print(f"  Created {len(df_traffic)} web visit records")
 print("Generating survey_results.csv...")
 
 n_responses = 500
+comment_options = np.array([
+    'Great service!', 'Could be better', 'Very satisfied', 'Had some issues',
+    'Excellent experience', 'Average', 'Not what I expected', None, None, None
+], dtype=object)
 
 survey_questions = {
-    'response_id': [f'RESP{i:05d}' for i in range(1, n_responses + 1)],
-    'submission_date': [start_date + timedelta(days=random.randint(0, 90)) for _ in range(n_responses)],
-    'age_group': np.random.choice(['18-25', '26-35', '36-45', '46-55', '56-65', '65+', None], 
-                                  n_responses, p=[0.15, 0.25, 0.23, 0.17, 0.1, 0.05, 0.05]),
-    'gender': np.random.choice(['Male', 'Female', 'Other', 'Prefer not to say', None], 
-                               n_responses, p=[0.45, 0.45, 0.02, 0.05, 0.03]),
-    'satisfaction_score': np.random.choice([1, 2, 3, 4, 5, None], n_responses, p=[0.05, 0.1, 0.2, 0.35, 0.25, 0.05]),
-    'product_quality': np.random.choice(['Poor', 'Fair', 'Good', 'Very Good', 'Excellent', None], 
-                                       n_responses, p=[0.03, 0.07, 0.25, 0.35, 0.25, 0.05]),
-    'customer_service': np.random.choice(['Poor', 'Fair', 'Good', 'Very Good', 'Excellent', None], 
-                                        n_responses, p=[0.02, 0.08, 0.3, 0.32, 0.23, 0.05]),
-    'would_recommend': np.random.choice(['Yes', 'No', 'Maybe', None], n_responses, p=[0.6, 0.15, 0.2, 0.05]),
-    'annual_income': np.random.choice(['<$25k', '$25k-$50k', '$50k-$75k', '$75k-$100k', '>$100k', None], 
-                                     n_responses, p=[0.1, 0.2, 0.25, 0.22, 0.15, 0.08]),
-    'region': np.random.choice(['North', 'South', 'East', 'West', 'Central'], n_responses),
-    'comments': [random.choice([
-        'Great service!', 'Could be better', 'Very satisfied', 'Had some issues', 
-        'Excellent experience', 'Average', 'Not what I expected', None, None, None
-    ]) for _ in range(n_responses)]
+    'response_id': make_ids('RESP', np.arange(1, n_responses + 1), 5),
+    'submission_date': start_date + pd.to_timedelta(rng.integers(0, 91, n_responses), unit='D'),
+    'age_group': rng.choice(['18-25', '26-35', '36-45', '46-55', '56-65', '65+', None], 
+                            n_responses, p=[0.15, 0.25, 0.23, 0.17, 0.1, 0.05, 0.05]),
+    'gender': rng.choice(['Male', 'Female', 'Other', 'Prefer not to say', None], 
+                         n_responses, p=[0.45, 0.45, 0.02, 0.05, 0.03]),
+    'satisfaction_score': rng.choice([1, 2, 3, 4, 5, None], n_responses, p=[0.05, 0.1, 0.2, 0.35, 0.25, 0.05]),
+    'product_quality': rng.choice(['Poor', 'Fair', 'Good', 'Very Good', 'Excellent', None], 
+                                 n_responses, p=[0.03, 0.07, 0.25, 0.35, 0.25, 0.05]),
+    'customer_service': rng.choice(['Poor', 'Fair', 'Good', 'Very Good', 'Excellent', None], 
+                                  n_responses, p=[0.02, 0.08, 0.3, 0.32, 0.23, 0.05]),
+    'would_recommend': rng.choice(['Yes', 'No', 'Maybe', None], n_responses, p=[0.6, 0.15, 0.2, 0.05]),
+    'annual_income': rng.choice(['<$25k', '$25k-$50k', '$50k-$75k', '$75k-$100k', '>$100k', None], 
+                               n_responses, p=[0.1, 0.2, 0.25, 0.22, 0.15, 0.08]),
+    'region': rng.choice(['North', 'South', 'East', 'West', 'Central'], n_responses),
+    'comments': rng.choice(comment_options, n_responses)
 }
 
 df_survey = pd.DataFrame(survey_questions)
-df_survey = df_survey.sort_values('submission_date').reset_index(drop=True)
-df_survey.to_csv('datasets/survey_results.csv', index=False)
+df_survey = sort_by(df_survey, 'submission_date')
+save_dataset(df_survey, 'survey_results')
 print(f"  Created {len(df_survey)} survey responses (with intentional missing data)")
 
 print("\n✓ All datasets generated successfully!")
@@ -5,144 +5,425 @@ Run this script to verify your Python environment is correctly configured
 for the Python Data Analysis course.
 
 Usage:
-    python verify_setup.py
+    python verify_setup.py [--json] [--no-cache]
+
+--json prints the results as JSON (for CI and other tools) instead of the
+text report. JSON results are always freshly measured.
+
+A passing text report is saved in ~/.cache/training_prep/verify.json and
+replayed until the Python install, its packages or the datasets change.
 """
 
+import argparse
+import hashlib
+import io
+import json
+import os
+import re
 import sys
+import sysconfig
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from functools import lru_cache
+from importlib import import_module
+from importlib.util import find_spec
+
+try:
+    from importlib.metadata import version as dist_version, PackageNotFoundError
+except ImportError:  # Python 3.7 has no importlib.metadata
+    dist_version = None
+
+CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'training_prep', 'verify.json')
+
+# (package name, import name) pairs the course needs
+REQUIRED_PACKAGES = (
+    ('pandas', 'pandas'),
+    ('numpy', 'numpy'),
+    ('matplotlib', 'matplotlib'),
+    ('seaborn', 'seaborn'),
+    ('openpyxl', 'openpyxl'),
+    ('xlrd', 'xlrd'),
+)
 
-def check_python_version():
-    """Check if Python version is 3.7 or higher"""
-    print("Checking Python version...")
-    version = sys.version_info
-    if version.major >= 3 and version.minor >= 7:
-        print(f"  ✓ Python {version.major}.{version.minor}.{version.micro} (OK)")
+# Sample files expected in datasets/ (created by generate_datasets.py)
+DATASETS = (
+    'sales_data.csv',
+    'customer_data.csv',
+    'product_catalog.csv',
+    'web_traffic.csv',
+    'survey_results.csv',
+)
+
+# Heading shown above each check in the text report (packages use the
+# "required packages" heading)
+SECTION_TITLES = {
+    'python': "Checking Python version...",
+    'jupyter': "Checking Jupyter...",
+    'datasets': "Checking datasets...",
+    'quick_test': "Running quick test...",
+}
+
+def check_python_version(out=None):
+    """Check if Python version is 3.7 or higher (messages go to `out`, default stdout)"""
+    version = '.'.join(map(str, sys.version_info[:3]))
+    # Compare the whole tuple (checking major and minor separately would
+    # reject e.g. a future 4.0)
+    if sys.version_info >= (3, 7):
+        print(f"  ✓ Python {version} (OK)", file=out)
         return True
     else:
-        print(f"  ✗ Python {version.major}.{version.minor}.{version.micro} (Need 3.7+)")
+        print(f"  ✗ Python {version} (Need 3.7+)", file=out)
         return False
 
-def check_package(package_name, import_name=None):
-    """Check if a package is installed and importable"""
+def _normalize(name):
+    """Normalize a distribution name the way pip does ('Foo_Bar' -> 'foo-bar')"""
+    return re.sub(r'[-_.]+', '-', name).lower()
+
+@lru_cache(maxsize=None)
+def _installed_distributions():
+    """
+    Map every distribution in site-packages to its version
+
+    One listing of site-packages answers all the package checks: each
+    installed distribution leaves a '<name>-<version>.dist-info' folder.
+    """
+    paths = sysconfig.get_paths()
+    installed = {}
+    for folder in {paths['purelib'], paths['platlib']}:
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.dist-info'):
+                        name, _, version = entry.name[:-len('.dist-info')].partition('-')
+                        installed[_normalize(name)] = version
+        except OSError:
+            pass
+    return installed
+
+@lru_cache(maxsize=None)
+def _module_available(package_name, import_name):
+    """
+    Look up a package without importing it (cached, prints nothing)
+
+    A package that is already imported (e.g. when run from a larger session)
+    is answered from sys.modules. Packages listed in site-packages are
+    answered straight from that listing.
+    Anything else (user or editable installs) is located on disk with
+    find_spec and its version read from the package metadata, so heavy
+    packages (pandas, matplotlib) are normally never loaded here. Only a
+    package without metadata (or Python 3.7) is imported, to read its
+    __version__.
+
+    Returns:
+    - (found, version) tuple
+    """
+    module = sys.modules.get(import_name)
+    version = getattr(module, '__version__', None)
+    if version:
+        return True, version
+    
+    version = _installed_distributions().get(_normalize(package_name))
+    if version:
+        return True, version
+    
+    try:
+        found = find_spec(import_name) is not None
+    except (ImportError, ValueError):
+        # find_spec can fail on unusual installs - fall back to a real import
+        try:
+            __import__(import_name)
+            found = True
+        except ImportError:
+            found = False
+    
+    if not found:
+        return False, 'unknown'
+    
+    if dist_version is not None:
+        try:
+            return True, dist_version(package_name)
+        except PackageNotFoundError:
+            pass
+    try:
+        module = import_module(import_name)
+    except ImportError:
+        return True, 'unknown'
+    return True, getattr(module, '__version__', 'unknown')
+
+def check_package(package_name, import_name=None, out=None):
+    """Check if a package is installed (messages go to `out`, default stdout)"""
     if import_name is None:
         import_name = package_name
     
+    found, version = _module_available(package_name, import_name)
+    if found:
+        print(f"  ✓ {package_name} {version}", file=out)
+    else:
+        print(f"  ✗ {package_name} NOT INSTALLED", file=out)
+    return found
+
+@lru_cache(maxsize=None)
+def _has(import_name):
+    """True if the module is installed (cached, located with find_spec - not imported)"""
     try:
-        module = __import__(import_name)
-        version = getattr(module, '__version__', 'unknown')
-        print(f"  ✓ {package_name} {version}")
-        return True
-    except ImportError:
-        print(f"  ✗ {package_name} NOT INSTALLED")
+        return find_spec(import_name) is not None
+    except (ImportError, ValueError):
         return False
 
-def check_datasets():
-    """Check if sample datasets are present"""
-    import os
-    
-    print("\nChecking datasets...")
-    datasets = [
-        'sales_data.csv',
-        'customer_data.csv',
-        'product_catalog.csv',
-        'web_traffic.csv',
-        'survey_results.csv'
-    ]
+def _scan_datasets():
+    """
+    Look up the sample files with one listing of datasets/
+
+    One directory listing instead of an exists() + getsize() per file,
+    keeping only the entries we are looking for.
+
+    Returns:
+    - {file name: (mtime_ns, size)} for the DATASETS files that exist
+    """
+    expected = frozenset(DATASETS)
+    found = {}
+    try:
+        with os.scandir('datasets') as entries:
+            for entry in entries:
+                if entry.name not in expected:
+                    continue
+                # A broken link is listed but can't be stat'ed - not found
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                found[entry.name] = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        pass
+    return found
+
+def check_datasets(found=None, out=None):
+    """
+    Check if sample datasets are present (messages go to `out`, default stdout)
+
+    Parameters:
+    - found: result of _scan_datasets(), scanned here if not given
+    """
+    if found is None:
+        found = _scan_datasets()
     
     all_present = True
-    for dataset in datasets:
-        path = os.path.join('datasets', dataset)
-        if os.path.exists(path):
-            size_mb = os.path.getsize(path) / 1024 / 1024
-            print(f"  ✓ {dataset} ({size_mb:.2f} MB)")
-        else:
-            print(f"  ✗ {dataset} NOT FOUND")
+    for dataset in DATASETS:
+        try:
+            size_mb = found[dataset][1] / 1024 / 1024
+        except KeyError:
+            print(f"  ✗ {dataset} NOT FOUND", file=out)
             all_present = False
+        else:
+            print(f"  ✓ {dataset} ({size_mb:.2f} MB)", file=out)
     
     return all_present
 
-def check_jupyter():
-    """Check if Jupyter is installed"""
-    print("\nChecking Jupyter...")
-    try:
-        import jupyter
-        print("  ✓ Jupyter installed")
+def check_jupyter(out=None):
+    """Check if Jupyter is installed (messages go to `out`, default stdout)"""
+    if _has('jupyter'):
+        print("  ✓ Jupyter installed", file=out)
         return True
-    except ImportError:
-        # Jupyter might not have __init__.py, check notebook instead
-        try:
-            import notebook
-            print("  ✓ Jupyter Notebook installed")
-            return True
-        except ImportError:
-            print("  ✗ Jupyter NOT INSTALLED")
-            return False
+    # Jupyter might not have __init__.py, check notebook instead
+    if _has('notebook'):
+        print("  ✓ Jupyter Notebook installed", file=out)
+        return True
+    print("  ✗ Jupyter NOT INSTALLED", file=out)
+    return False
 
-def run_quick_test():
-    """Run a quick data analysis test"""
-    print("\nRunning quick test...")
+def run_quick_test(out=None):
+    """Run a quick data analysis test (messages go to `out`, default stdout)"""
     try:
-        import pandas as pd
+        import pandas as pd  # importing is the check - pandas isn't used below
         import numpy as np
-        import matplotlib.pyplot as plt
+        import matplotlib.pyplot  # importing is the check - see the plot below
+        from matplotlib.figure import Figure
         
-        # Create sample data
-        df = pd.DataFrame({
-            'A': np.random.randint(1, 100, 10),
-            'B': np.random.randint(1, 100, 10)
-        })
+        # Create sample data (one seeded draw, so the test is repeatable)
+        a, b = np.random.default_rng(0).integers(1, 100, size=(2, 10))
         
-        # Perform operations
-        total = df['A'].sum()
-        avg = df['B'].mean()
+        # Perform operations (straight on the NumPy arrays)
+        total = int(a.sum())
+        avg = float(b.mean())
         
-        # Create a simple plot (don't show it)
-        fig, ax = plt.subplots()
-        ax.plot(df['A'], df['B'])
-        plt.close(fig)
+        # Create a simple plot (don't show it). A bare Figure isn't managed
+        # by pyplot, so the backend of the calling session is left alone
+        ax = Figure().subplots()
+        ax.plot(a, b)
         
-        print("  ✓ Basic operations work correctly")
+        print("  ✓ Basic operations work correctly", file=out)
         return True
     except Exception as e:
-        print(f"  ✗ Error during test: {str(e)}")
+        print(f"  ✗ Error during test: {str(e)}", file=out)
         return False
 
-def main():
-    """Main verification function"""
-    print("="*60)
-    print("Python Data Analysis - Setup Verification")
-    print("="*60)
+def _timed(name, check, *args):
+    """
+    Run one check with its messages captured
+
+    Returns:
+    - {'name', 'ok', 'skipped', 'detail', 'elapsed_ms'} result dict
+    """
+    buffer = io.StringIO()
+    start = time.perf_counter()
+    ok = check(*args, out=buffer)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    return {'name': name, 'ok': ok, 'skipped': False,
+            'detail': buffer.getvalue().rstrip('\n'), 'elapsed_ms': round(elapsed_ms, 3)}
+
+def _cache_key(datasets_scan):
+    """
+    Fingerprint of everything the checks depend on
+
+    Covers what is checked (the required packages and datasets, plus this
+    script's own source), the interpreter, the folders on sys.path (installing
+    or removing a package changes their modification time) and the sample
+    files.
+
+    Parameters:
+    - datasets_scan: future running _scan_datasets(), only waited on at the end
+    """
+    paths = []
+    for path in sys.path:
+        try:
+            paths.append((path, os.stat(path or '.').st_mtime_ns))
+        except OSError:
+            pass
+    # Editing the checks must invalidate the cache even when the editor keeps
+    # the folder's modification time
+    with open(__file__, 'rb') as f:
+        source = hashlib.blake2b(f.read()).hexdigest()
+    datasets = sorted(datasets_scan.result().items())
+    state = [source, REQUIRED_PACKAGES, DATASETS,
+             sys.executable, sys.version, os.getcwd(), paths, datasets]
+    return hashlib.blake2b(json.dumps(state).encode()).hexdigest()
+
+def _load_cached(key):
+    """Return the saved {key, rc, output} record if it matches `key`, else None"""
+    try:
+        with open(CACHE_FILE, encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return cached if cached.get('key') == key else None
+
+def _save_cached(key, rc, output):
+    """Save a run's result; a read-only home directory just means no cache"""
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'key': key, 'rc': rc, 'output': output}, f)
+    except OSError:
+        pass
+
+def main(argv=()):
+    """
+    Main verification function
+
+    Parameters:
+    - argv: command-line options (only the script entry point passes
+      sys.argv, so calling main() from a notebook or test runner works)
+    """
+    parser = argparse.ArgumentParser(description="Verify the course setup")
+    parser.add_argument('--json', dest='format', action='store_const',
+                        const='json', default='text',
+                        help="print the results as JSON instead of a text report")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="ignore saved results and run every check again")
+    args = parser.parse_args(argv)
     
-    all_checks = []
+    # Listing datasets/ doesn't depend on anything else, so start it in the
+    # background while the sys.path stats and package lookups run
+    with ThreadPoolExecutor(max_workers=1) as background:
+        datasets_scan = background.submit(_scan_datasets)
+        
+        # Only the text report is cached: JSON consumers read the timings,
+        # which must come from this run
+        key = None
+        if args.format == 'text' and not args.no_cache:
+            key = _cache_key(datasets_scan)
+            cached = _load_cached(key)
+            if cached is not None:
+                sys.stdout.write(cached['output'])
+                return cached['rc']
+        
+        results = run_checks(datasets_scan)
     
+    # Collect the whole report and write it out in one go
+    rc = 0 if all(r['ok'] for r in results) else 1
+    render = render_json if args.format == 'json' else render_text
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        render(results)
+    output = buffer.getvalue()
+    sys.stdout.write(output)
+    # Only passing runs are saved - a failing one is about to be fixed
+    if rc == 0 and key is not None:
+        _save_cached(key, rc, output)
+    return rc
+
+def run_checks(datasets_scan=None):
+    """
+    Run every check (prints nothing)
+
+    Parameters:
+    - datasets_scan: optional future running _scan_datasets(), so the listing
+      can start before the checks do
+
+    Returns:
+    - list of {'name', 'ok', 'skipped', 'detail', 'elapsed_ms'} dicts, in
+      report order
+    """
     # Check Python version
-    all_checks.append(check_python_version())
-    
-    # Check required packages
-    print("\nChecking required packages...")
-    required_packages = [
-        ('pandas', 'pandas'),
-        ('numpy', 'numpy'),
-        ('matplotlib', 'matplotlib'),
-        ('seaborn', 'seaborn'),
-        ('openpyxl', 'openpyxl'),
-        ('xlrd', 'xlrd'),
-    ]
+    results = [_timed('python', check_python_version)]
     
-    for package_name, import_name in required_packages:
-        all_checks.append(check_package(package_name, import_name))
+    # Package, Jupyter and dataset checks are independent (mostly disk
+    # lookups), so run them side by side and keep the results in order
+    tasks = [(package_name, check_package, package_name, import_name)
+             for package_name, import_name in REQUIRED_PACKAGES]
+    tasks += [('jupyter', check_jupyter), ('datasets', check_datasets)]
+    if datasets_scan is not None:
+        tasks[-1] = ('datasets', lambda out: check_datasets(datasets_scan.result(), out=out))
     
-    # Check Jupyter
-    all_checks.append(check_jupyter())
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(_timed, *task) for task in tasks]
+        results += [future.result() for future in futures]
     
-    # Check datasets
-    all_checks.append(check_datasets())
+    # Run quick test (only worth the heavy imports if everything else passed)
+    if all(r['ok'] for r in results):
+        results.append(_timed('quick_test', run_quick_test))
+    else:
+        results.append({'name': 'quick_test', 'ok': False, 'skipped': True,
+                        'detail': "Skipping quick test (fix the failed checks above first)",
+                        'elapsed_ms': 0.0})
+    return results
+
+def render_json(results):
+    """Print the results as one JSON document"""
+    report = {'checks': results, 'ok': all(r['ok'] for r in results)}
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+def render_text(results):
+    """Print the human-readable report"""
+    print("="*60)
+    print("Python Data Analysis - Setup Verification")
+    print("="*60)
     
-    # Run quick test
-    all_checks.append(run_quick_test())
+    section = None
+    for result in results:
+        if result['skipped']:
+            print("\n" + result['detail'])
+            continue
+        title = SECTION_TITLES.get(result['name'], "Checking required packages...")
+        if title != section:
+            print(title if section is None else "\n" + title)
+            section = title
+        print(result['detail'])
     
     # Summary
     print("\n" + "="*60)
-    if all(all_checks):
+    if all(r['ok'] for r in results):
         print("✓ ALL CHECKS PASSED!")
         print("="*60)
         print("\nYou're ready for the course! 🎉")
@@ -162,8 +443,7 @@ def main():
         print("  python generate_datasets.py")
     
     print("")
-    return 0 if all(all_checks) else 1
 
 if __name__ == '__main__':
-    sys.exit(main())
+    sys.exit(main(sys.argv[1:]))
 